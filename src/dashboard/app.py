@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import heapq
+import random
+import time
 from datetime import datetime
+from typing import Awaitable, Callable
 
 from rich.panel import Panel
 from rich.table import Table
@@ -9,6 +14,7 @@ from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import Footer, Header, Static
 
 from .collectors import DashboardCollectors, human_bytes_per_second, human_seconds
@@ -23,6 +29,16 @@ class FocusPanel(Static):
     can_focus = True
 
 
+@functools.lru_cache(maxsize=64)
+def _bar_markup(filled: int, width: int) -> str:
+    return f"[bold #b69cff]{'█' * filled}[/][#4d3f73]{'░' * (width - filled)}[/]"
+
+
+@functools.lru_cache(maxsize=64)
+def _progress_markup(filled: int, width: int) -> str:
+    return f"[bold #c3b0ff]{'▰' * filled}[/][#4d3f73]{'▱' * (width - filled)}[/]"
+
+
 class DashboardApp(App[None]):
     CSS_PATH = "styles.tcss"
     BINDINGS = [
@@ -57,6 +73,9 @@ class DashboardApp(App[None]):
         self._up_view = 0.0
         self._down_view = 0.0
         self._title_frame = 0
+        self._last_rev = {"services": -1, "torrents": -1, "metrics": -1}
+        self._anim_timer: Timer | None = None
+        self._rng = random.Random()
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -73,11 +92,16 @@ class DashboardApp(App[None]):
         self.state.motion_mode = self.motion_mode
         self.query_one("#services_panel", FocusPanel).focus()
 
-        self.set_interval(0.25, self._render_ui)
+        self._w_top = self.query_one("#top_strip", Static)
+        self._w_services = self.query_one("#services_panel", Static)
+        self._w_torrents = self.query_one("#torrents_panel", Static)
+        self._w_metrics = self.query_one("#metrics_panel", Static)
+
+        self._render_ui()
+        self._sync_anim_timer()
         self._tasks = [
-            asyncio.create_task(self._loop_services(), name="services-loop"),
-            asyncio.create_task(self._loop_torrents(), name="torrents-loop"),
-            asyncio.create_task(self._loop_metrics(), name="metrics-loop"),
+            asyncio.create_task(self._master_loop(), name="collector-loop"),
+            asyncio.create_task(self._render_worker(), name="render-loop"),
         ]
 
     async def on_unmount(self) -> None:
@@ -145,42 +169,137 @@ class DashboardApp(App[None]):
         index = order.index(self.motion_mode)
         self.motion_mode = order[(index + 1) % len(order)]
         self.state.motion_mode = self.motion_mode
+        self._sync_anim_timer()
+
+    @property
+    def _ui_active(self) -> bool:
+        # The dashboard is hidden while a game or menu screen sits on top.
+        return len(self.screen_stack) <= 1
+
+    def pop_screen(self):
+        screen = super().pop_screen()
+        if self._ui_active:
+            self.state.updated.set()
+        return screen
+
+    def _loop_sleep_seconds(self, base: float) -> float:
+        # Poll 4x slower while the dashboard is not the visible screen.
+        return base if self._ui_active else base * 4
+
+    def _collector_jobs(
+        self,
+    ) -> dict[str, tuple[Callable[[], Awaitable[None]], Callable[[], float]]]:
+        jobs: dict[str, tuple[Callable[[], Awaitable[None]], Callable[[], float]]] = {
+            "torrents": (
+                self.collectors.refresh_torrents,
+                lambda: self.config.refresh_torrents_seconds,
+            ),
+            "metrics": (
+                self.collectors.refresh_host_metrics,
+                lambda: self.config.refresh_metrics_seconds,
+            ),
+        }
+        for service in self.config.services:
+            jobs[service.name] = (
+                functools.partial(self.collectors.refresh_service, service),
+                functools.partial(self.collectors.next_delay, service),
+            )
+        return jobs
+
+    async def _master_loop(self) -> None:
+        # One task drives every collector from a heap of next-due times:
+        # a single wakeup per deadline, with coinciding jobs gathered
+        # together. Intervals are re-read each cycle to pick up backoff,
+        # and a slow fetch eats into its own idle time instead of
+        # stacking onto the period.
+        jobs = self._collector_jobs()
+        now = time.monotonic()
+        heap: list[tuple[float, str]] = [(now, "torrents"), (now, "metrics")]
+        for service in self.config.services:
+            heap.append((now + service.phase_seconds, service.name))
+        heapq.heapify(heap)
 
-    async def _loop_services(self) -> None:
         while True:
-            await self.collectors.refresh_services()
-            await asyncio.sleep(self.config.refresh_services_seconds)
-
-    async def _loop_torrents(self) -> None:
+            now = time.monotonic()
+            due: list[str] = []
+            while heap and heap[0][0] <= now:
+                due.append(heapq.heappop(heap)[1])
+
+            if due:
+                start = time.monotonic()
+                results = await asyncio.gather(
+                    *(jobs[name][0]() for name in due), return_exceptions=True
+                )
+                for name, result in zip(due, results):
+                    # A failing job is logged and rescheduled like any
+                    # other: one bad collector must neither kill this
+                    # loop nor fall out of the heap, and names popped
+                    # alongside it keep their slots too.
+                    if isinstance(result, BaseException):
+                        self.log.error(f"{name} refresh failed: {result!r}")
+                    # +-10% jitter keeps deadlines that drifted together
+                    # from re-aligning into one repeated burst.
+                    interval = self._loop_sleep_seconds(jobs[name][1]())
+                    next_due = start + interval * self._rng.uniform(0.9, 1.1)
+                    if next_due < time.monotonic():
+                        self.log.warning(f"{name} refresh overran its interval")
+                        next_due = time.monotonic() + 0.25
+                    heapq.heappush(heap, (next_due, name))
+
+            await asyncio.sleep(max(0.05, heap[0][0] - time.monotonic()))
+
+    async def _render_worker(self) -> None:
         while True:
-            await self.collectors.refresh_torrents()
-            await asyncio.sleep(self.config.refresh_torrents_seconds)
+            await self.state.updated.wait()
+            self.state.updated.clear()
+            self._render_ui()
 
-    async def _loop_metrics(self) -> None:
-        while True:
-            await self.collectors.refresh_host_metrics()
-            await asyncio.sleep(self.config.refresh_metrics_seconds)
+    def _sync_anim_timer(self) -> None:
+        if self.motion_mode == "off":
+            if self._anim_timer is not None:
+                self._anim_timer.stop()
+                self._anim_timer = None
+        elif self._anim_timer is None:
+            self._anim_timer = self.set_interval(0.1, self._animate_metrics)
 
-    def _render_ui(self) -> None:
-        top = self.query_one("#top_strip", Static)
-        services = self.query_one("#services_panel", Static)
-        torrents = self.query_one("#torrents_panel", Static)
-        metrics = self.query_one("#metrics_panel", Static)
+    def _animate_metrics(self) -> None:
+        if self._ui_active and self._metrics_animating():
+            self._w_metrics.update(self._build_metrics_panel())
 
-        top.update(self._build_top_strip())
-        services.update(self._build_services_panel())
-        torrents.update(self._build_torrents_panel())
-        metrics.update(self._build_metrics_panel())
+    def _render_ui(self) -> None:
+        if not self._ui_active:
+            return
+        state = self.state
+        now = datetime.now()
+        if state.services_rev != self._last_rev["services"]:
+            self._last_rev["services"] = state.services_rev
+            self._w_services.update(self._build_services_panel())
+        if state.torrents_rev != self._last_rev["torrents"]:
+            self._last_rev["torrents"] = state.torrents_rev
+            self._w_torrents.update(self._build_torrents_panel())
+        if state.metrics_rev != self._last_rev["metrics"] or self._metrics_animating():
+            self._last_rev["metrics"] = state.metrics_rev
+            self._w_metrics.update(self._build_metrics_panel())
+        self._w_top.update(self._build_top_strip(now))
+
+    def _metrics_animating(self) -> bool:
+        metrics = self.state.host_metrics
+        return (
+            abs(self._cpu_view - metrics.cpu_percent) > 0.05
+            or abs(self._mem_view - metrics.memory_percent) > 0.05
+            or abs(self._up_view - metrics.network_sent_bps) > 1.0
+            or abs(self._down_view - metrics.network_recv_bps) > 1.0
+        )
 
-    def _build_top_strip(self) -> Panel:
+    def _build_top_strip(self, now: datetime) -> Panel:
         up_count = sum(1 for item in self.state.services.values() if item.is_up)
         total = max(1, len(self.state.services))
         down = total - up_count
-        now = datetime.now().strftime("%H:%M:%S")
+        now_str = now.strftime("%H:%M:%S")
 
         indicator = self._pulse_indicator()
         status = f"{indicator}  Services: [bold]{up_count}/{total}[/] up • [bold]{down}[/] down"
-        status += f"    Motion: [bold]{self.motion_mode}[/]    Updated: [bold]{now}[/]"
+        status += f"    Motion: [bold]{self.motion_mode}[/]    Updated: [bold]{now_str}[/]"
         return Panel(status, title="Ops Status", border_style="purple")
 
     def _build_services_panel(self) -> Panel:
@@ -191,24 +310,30 @@ class DashboardApp(App[None]):
         table.add_column("Latency")
         table.add_column("Last Check")
 
+        now_monotonic = time.monotonic()
+        rows: list[tuple[str, str, str, str, str]] = []
         for name in ["Sonarr", "Radarr", "Plex", "Home Assistant", "Prowlarr", "SSH"]:
             item = self.state.services.get(name)
             if item is None:
-                table.add_row(name, "[yellow]Unknown[/]", "-", "-", "-")
+                rows.append((name, "[yellow]Unknown[/]", "-", "-", "-"))
                 continue
 
             state_text = "[green]UP[/]" if item.is_up else "[red]DOWN[/]"
             uptime = human_seconds(item.uptime_seconds) if item.is_up else "0m 00s"
             latency = f"{item.latency_ms:.0f} ms" if item.last_check else "-"
             if item.last_check:
-                elapsed = (datetime.now() - item.last_check).total_seconds()
+                elapsed = now_monotonic - item.last_check_monotonic
                 if elapsed < 1:
                     last = f"{elapsed * 1000:.0f} ms ago"
                 else:
                     last = f"{elapsed:.1f} s ago"
             else:
                 last = "-"
-            table.add_row(name, state_text, uptime, latency, last)
+            rows.append((name, state_text, uptime, latency, last))
+
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
 
         return Panel(table, title="Service Uptime", border_style="#8f7ad4")
 
@@ -221,19 +346,20 @@ class DashboardApp(App[None]):
         table.add_column("UP")
         table.add_column("ETA")
 
-        rows = self.state.torrents[:14]
-        if not rows:
+        torrents = self.state.torrents
+        if not len(torrents):
             table.add_row("No active torrents", "-", "-", "-", "-", "-")
         else:
-            for item in rows:
-                progress = self._progress_bar(item.progress)
-                eta = "∞" if item.eta_seconds < 0 else human_seconds(item.eta_seconds)
+            for i in range(min(14, len(torrents))):
+                progress = self._progress_bar(torrents.progress[i])
+                eta_seconds = torrents.eta_seconds[i]
+                eta = "∞" if eta_seconds < 0 else human_seconds(eta_seconds)
                 table.add_row(
-                    item.name[:48],
+                    torrents.names[i][:48],
                     progress,
-                    item.state,
-                    human_bytes_per_second(item.dlspeed),
-                    human_bytes_per_second(item.upspeed),
+                    torrents.states[i],
+                    human_bytes_per_second(torrents.dlspeed[i]),
+                    human_bytes_per_second(torrents.upspeed[i]),
                     eta,
                 )
 
@@ -255,20 +381,25 @@ class DashboardApp(App[None]):
         table.add_column("Metric", style="bold #d5c9ff")
         table.add_column("Value", ratio=2)
 
-        table.add_row("CPU", f"{self._bar(self._cpu_view)} {self._cpu_view:5.1f}%")
-        table.add_row("Memory", f"{self._bar(self._mem_view)} {self._mem_view:5.1f}%")
-        table.add_row("Network Down", f"{human_bytes_per_second(self._down_view)}")
-        table.add_row("Network Up", f"{human_bytes_per_second(self._up_view)}")
+        rows = (
+            ("CPU", f"{self._bar(self._cpu_view)} {self._cpu_view:5.1f}%"),
+            ("Memory", f"{self._bar(self._mem_view)} {self._mem_view:5.1f}%"),
+            ("Network Down", human_bytes_per_second(self._down_view)),
+            ("Network Up", human_bytes_per_second(self._up_view)),
+        )
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
 
         return Panel(table, title="Host Metrics", border_style="#8f7ad4")
 
     def _bar(self, value: float, width: int = 22) -> str:
         filled = int((max(0.0, min(100.0, value)) / 100) * width)
-        return f"[bold #b69cff]{'█' * filled}[/][#4d3f73]{'░' * (width - filled)}[/]"
+        return _bar_markup(filled, width)
 
     def _progress_bar(self, percent: float, width: int = 16) -> str:
         filled = int((max(0.0, min(100.0, percent)) / 100) * width)
-        return f"[bold #c3b0ff]{'▰' * filled}[/][#4d3f73]{'▱' * (width - filled)}[/] {percent:5.1f}%"
+        return f"{_progress_markup(filled, width)} {percent:5.1f}%"
 
     def _motion_alpha(self) -> float:
         if self.motion_mode == "off":
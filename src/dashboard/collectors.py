@@ -2,41 +2,112 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import re
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import httpx
+import orjson
 import psutil
 
 from .config import AppConfig, ServiceEndpoint
-from .models import DashboardState, ServiceStatus, TorrentItem
+from .models import DashboardState, ServiceStatus, TorrentTable
+
+# Liveness only needs headers; keep the probe budget well under the
+# 8 s client default so a dead service fails fast.
+_PROBE_TIMEOUT = httpx.Timeout(connect=2.0, read=3.0, write=3.0, pool=3.0)
+
+# /proc/net/dev rows: "iface: rx_bytes <7 counters> tx_bytes ..."
+_NETDEV_RE = re.compile(rb"^\s*\S+:\s*(\d+)(?:\s+\d+){7}\s+(\d+)", re.M)
+
+_TLS_TRUST_RE = re.compile(
+    r"CERTIFICATE_VERIFY_FAILED|SEC_E_UNTRUSTED_ROOT|CERTIFICATE.*UNTRUST",
+    re.IGNORECASE | re.DOTALL,
+)
 
 
 class DashboardCollectors:
     def __init__(self, config: AppConfig, state: DashboardState) -> None:
         self.config = config
         self.state = state
-        self.client = httpx.AsyncClient(timeout=8, follow_redirects=True)
+        # One pooled client for all service probes: keep-alive plus HTTP/2
+        # lets repeated probes to the same host reuse a single connection
+        # instead of paying TCP+TLS setup every cycle.
+        limits = httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=16,
+            keepalive_expiry=60.0,
+        )
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(6.0, connect=2.0),
+            http2=True,
+            follow_redirects=True,
+            limits=limits,
+        )
         self._insecure_client = httpx.AsyncClient(
-            timeout=8,
+            timeout=httpx.Timeout(6.0, connect=2.0),
+            http2=True,
             follow_redirects=True,
+            limits=limits,
             verify=False,
         )
+        self.qbit_client = httpx.AsyncClient(
+            base_url=config.qbit.url,
+            timeout=8,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
         self._service_started_at: dict[str, float] = {}
-        self._last_net = psutil.net_io_counters()
+        self._svc_fail_count: dict[str, int] = {}
+        self._netdev_file = None
+        if sys.platform.startswith("linux"):
+            try:
+                self._netdev_file = open("/proc/net/dev", "rb")
+            except OSError:
+                self._netdev_file = None
+        self._last_net_recv, self._last_net_sent = self._sample_net_counters()
         self._last_net_ts = time.time()
-        self._qbit_sid: str = ""
+        # Dedicated single worker so psutil's syscalls never block the
+        # event loop and samples stay serialized.
+        self._metrics_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="host-metrics"
+        )
+        self._qbit_login_lock = asyncio.Lock()
+        self._qbit_logged_in = False
+        self._qbit_consecutive_fail = 0
+        self._qbit_skip_until = 0.0
 
     async def close(self) -> None:
         await self.client.aclose()
         await self._insecure_client.aclose()
+        await self.qbit_client.aclose()
+        self._metrics_executor.shutdown(wait=False)
+        if self._netdev_file is not None:
+            self._netdev_file.close()
+
+    def _sample_net_counters(self) -> tuple[int, int]:
+        """Total (bytes_recv, bytes_sent) across all interfaces."""
+        if self._netdev_file is not None:
+            # Reread the kept-open proc file; far cheaper than the
+            # per-NIC namedtuple aggregation psutil does every second.
+            self._netdev_file.seek(0)
+            data = self._netdev_file.read()
+            recv = sent = 0
+            for match in _NETDEV_RE.finditer(data):
+                recv += int(match.group(1))
+                sent += int(match.group(2))
+            return recv, sent
+        counters = psutil.net_io_counters()
+        return counters.bytes_recv, counters.bytes_sent
 
     async def refresh_services(self) -> None:
         await asyncio.gather(
-            *(self._refresh_one_service(service) for service in self.config.services)
+            *(self.refresh_service(service) for service in self.config.services)
         )
 
-    async def _refresh_one_service(self, service: ServiceEndpoint) -> None:
+    async def refresh_service(self, service: ServiceEndpoint) -> None:
         start = time.perf_counter()
         headers: dict[str, str] = {}
         if service.api_key:
@@ -46,6 +117,9 @@ class DashboardCollectors:
             headers["X-Plex-Token"] = service.token
 
         is_up, error = await self._probe_service_with_fallback(service, headers)
+        self._svc_fail_count[service.name] = (
+            0 if is_up else self._svc_fail_count.get(service.name, 0) + 1
+        )
 
         latency_ms = (time.perf_counter() - start) * 1000
         now = datetime.now()
@@ -57,6 +131,7 @@ class DashboardCollectors:
         status.name = service.name
         status.is_up = is_up
         status.last_check = now
+        status.last_check_monotonic = time.monotonic()
         status.latency_ms = latency_ms
         status.error = "" if is_up else error
 
@@ -69,42 +144,99 @@ class DashboardCollectors:
             self._service_started_at.pop(service.name, None)
             status.uptime_seconds = 0.0
 
+        self.state.services_rev += 1
+        self.state.updated.set()
+
+    def next_delay(self, service: ServiceEndpoint) -> float:
+        """Seconds until this service should be probed again.
+
+        Doubles per consecutive failure (capped at 60 s) so a down service
+        does not burn a pair of 8 s timeouts every cycle.
+        """
+        failures = self._svc_fail_count.get(service.name, 0)
+        if failures == 0:
+            return float(service.interval_seconds)
+        return min(60.0, service.interval_seconds * 2 ** min(failures, 6))
+
     async def refresh_torrents(self) -> None:
+        # Circuit breaker: after repeated failures, skip the login+fetch
+        # pair entirely until the retry window elapses.
+        if self._qbit_consecutive_fail and time.monotonic() < self._qbit_skip_until:
+            return
+
         try:
-            await self._qbit_login()
-            response = await self.client.get(
-                f"{self.config.qbit.url}/api/v2/torrents/info"
+            # Let qBittorrent sort and bound the list instead of paying to
+            # parse every torrent on large instances. filter=active can
+            # still include finished stalled uploads, so the completion
+            # filter below stays.
+            response = await self._qbit_get_with_reauth(
+                "/api/v2/torrents/info",
+                params={
+                    "filter": "active",
+                    "sort": "added_on",
+                    "reverse": "true",
+                    "limit": self.config.qbit.fetch_limit,
+                },
             )
-            if response.status_code == 403:
-                await self._qbit_login(force=True)
-                response = await self.client.get(
-                    f"{self.config.qbit.url}/api/v2/torrents/info"
-                )
+        except httpx.HTTPError:
+            self._qbit_refresh_failed()
+            return
 
-            response.raise_for_status()
-            payload = response.json()
-            torrents: list[TorrentItem] = []
+        if response.status_code >= 400:
+            self._qbit_refresh_failed()
+            return
+
+        try:
+            payload = orjson.loads(response.content)
+        except ValueError:
+            self._qbit_refresh_failed()
+            return
+
+        # A 200 from the wrong endpoint can carry any JSON shape; treat
+        # a payload that is not the expected list of dicts — or items
+        # with non-numeric fields — as a failed refresh, not a crash.
+        if not isinstance(payload, list):
+            self._qbit_refresh_failed()
+            return
+
+        torrents = TorrentTable()
+        try:
             for item in payload:
-                progress = float(item.get("progress", 0.0)) * 100
-                if progress >= 100 and item.get("state", "") in {
+                get = item.get
+                progress = float(get("progress", 0.0)) * 100
+                if progress >= 100 and get("state", "") in {
                     "uploading",
                     "stalledUP",
                 }:
                     continue
-                torrents.append(
-                    TorrentItem(
-                        name=str(item.get("name", "Unknown")),
-                        progress=progress,
-                        state=str(item.get("state", "unknown")),
-                        dlspeed=int(item.get("dlspeed", 0)),
-                        upspeed=int(item.get("upspeed", 0)),
-                        eta_seconds=int(item.get("eta", -1)),
-                        ratio=float(item.get("ratio", 0.0)),
-                    )
-                )
-            self.state.torrents = torrents
-        except Exception:
-            self.state.torrents = []
+                torrents.names.append(str(get("name", "Unknown")))
+                torrents.progress.append(progress)
+                torrents.states.append(str(get("state", "unknown")))
+                torrents.dlspeed.append(int(get("dlspeed", 0)))
+                torrents.upspeed.append(int(get("upspeed", 0)))
+                torrents.eta_seconds.append(int(get("eta", -1)))
+                torrents.ratio.append(float(get("ratio", 0.0)))
+        except (AttributeError, TypeError, ValueError):
+            self._qbit_refresh_failed()
+            return
+
+        self._qbit_consecutive_fail = 0
+        self.state.torrents = torrents
+        self.state.torrents_rev += 1
+        self.state.updated.set()
+
+    def _qbit_refresh_failed(self) -> None:
+        self._qbit_consecutive_fail += 1
+        if self._qbit_consecutive_fail >= 2:
+            delay = min(
+                60.0,
+                self.config.refresh_torrents_seconds
+                * 2 ** min(self._qbit_consecutive_fail, 6),
+            )
+            self._qbit_skip_until = time.monotonic() + delay
+        self.state.torrents = TorrentTable()
+        self.state.torrents_rev += 1
+        self.state.updated.set()
 
     async def _probe_service_with_fallback(
         self, service: ServiceEndpoint, headers: dict[str, str]
@@ -112,16 +244,16 @@ class DashboardCollectors:
         if service.probe_kind == "tcp":
             return await self._probe_tcp(service)
 
-        primary_probe_url = self._service_probe_url(service, service.url)
         primary_up, primary_error = await self._probe_http_url(
-            primary_probe_url, headers
+            service.local_probe_url, headers
         )
 
-        if primary_up or not service.remote_url.strip():
+        if primary_up or not service.remote_probe_url:
             return primary_up, primary_error
 
-        remote_probe_url = self._service_probe_url(service, service.remote_url)
-        remote_up, remote_error = await self._probe_http_url(remote_probe_url, headers)
+        remote_up, remote_error = await self._probe_http_url(
+            service.remote_probe_url, headers
+        )
         if remote_up:
             return True, ""
 
@@ -133,35 +265,42 @@ class DashboardCollectors:
         self, probe_url: str, headers: dict[str, str]
     ) -> tuple[bool, str]:
         try:
-            response = await self.client.get(probe_url, headers=headers)
-            if response.status_code < 500:
+            status = await self._probe_status(self.client, probe_url, headers)
+            if status < 500:
                 return True, ""
-            return False, f"HTTP {response.status_code}"
+            return False, f"HTTP {status}"
         except httpx.ConnectError as exc:
             message = str(exc)
             if self._is_tls_trust_error(message):
                 try:
-                    response = await self._insecure_client.get(
-                        probe_url, headers=headers
+                    status = await self._probe_status(
+                        self._insecure_client, probe_url, headers
                     )
-                    if response.status_code < 500:
+                    if status < 500:
                         return True, ""
-                    return False, f"HTTP {response.status_code}"
+                    return False, f"HTTP {status}"
                 except Exception as retry_exc:
                     return False, str(retry_exc)
             return False, message
         except Exception as exc:
             return False, str(exc)
 
+    @staticmethod
+    async def _probe_status(
+        client: httpx.AsyncClient, probe_url: str, headers: dict[str, str]
+    ) -> int:
+        response = await client.head(probe_url, headers=headers, timeout=_PROBE_TIMEOUT)
+        if response.status_code != 405:
+            return response.status_code
+        # Some servers reject HEAD; stream a GET and drop the body unread.
+        async with client.stream(
+            "GET", probe_url, headers=headers, timeout=_PROBE_TIMEOUT
+        ) as streamed:
+            return streamed.status_code
+
     @staticmethod
     def _is_tls_trust_error(message: str) -> bool:
-        text = message.upper()
-        return (
-            "CERTIFICATE_VERIFY_FAILED" in text
-            or "SEC_E_UNTRUSTED_ROOT" in text
-            or "CERTIFICATE" in text
-            and "UNTRUST" in text
-        )
+        return _TLS_TRUST_RE.search(message) is not None
 
     async def _probe_tcp(self, service: ServiceEndpoint) -> tuple[bool, str]:
         host = service.tcp_host.strip()
@@ -186,31 +325,54 @@ class DashboardCollectors:
                 with contextlib.suppress(Exception):
                     await writer.wait_closed()
 
+    async def _qbit_get_with_reauth(
+        self, path: str, params: dict | None = None
+    ) -> httpx.Response:
+        if not self._qbit_logged_in:
+            await self._qbit_login()
+        response = await self.qbit_client.get(path, params=params)
+        if response.status_code == 403:
+            await self._qbit_login(force=True)
+            response = await self.qbit_client.get(path, params=params)
+        return response
+
     async def _qbit_login(self, force: bool = False) -> None:
-        if self._qbit_sid and not force:
-            return
-        response = await self.client.post(
-            f"{self.config.qbit.url}/api/v2/auth/login",
-            data={
-                "username": self.config.qbit.username,
-                "password": self.config.qbit.password,
-            },
+        # The lock prevents a re-login stampede when several requests hit 403.
+        async with self._qbit_login_lock:
+            if self._qbit_logged_in and not force:
+                return
+            response = await self.qbit_client.post(
+                "/api/v2/auth/login",
+                data={
+                    "username": self.config.qbit.username,
+                    "password": self.config.qbit.password,
+                },
+            )
+            response.raise_for_status()
+            # The SID cookie lands in the client's jar and rides along on
+            # every later request to the same host.
+            self._qbit_logged_in = True
+
+    def _sample_host(self) -> tuple[float, float, tuple[int, int]]:
+        return (
+            psutil.cpu_percent(interval=None),
+            psutil.virtual_memory().percent,
+            self._sample_net_counters(),
         )
-        response.raise_for_status()
-        self._qbit_sid = response.cookies.get("SID", "")
 
     async def refresh_host_metrics(self) -> None:
-        cpu = psutil.cpu_percent(interval=None)
-        memory = psutil.virtual_memory().percent
+        loop = asyncio.get_running_loop()
+        cpu, memory, (recv, sent) = await loop.run_in_executor(
+            self._metrics_executor, self._sample_host
+        )
 
         now = time.time()
-        current = psutil.net_io_counters()
         elapsed = max(0.001, now - self._last_net_ts)
 
-        sent_bps = max(0.0, (current.bytes_sent - self._last_net.bytes_sent) / elapsed)
-        recv_bps = max(0.0, (current.bytes_recv - self._last_net.bytes_recv) / elapsed)
+        sent_bps = max(0.0, (sent - self._last_net_sent) / elapsed)
+        recv_bps = max(0.0, (recv - self._last_net_recv) / elapsed)
 
-        self._last_net = current
+        self._last_net_recv, self._last_net_sent = recv, sent
         self._last_net_ts = now
 
         self.state.host_metrics.cpu_percent = cpu
@@ -218,31 +380,22 @@ class DashboardCollectors:
         self.state.host_metrics.network_sent_bps = sent_bps
         self.state.host_metrics.network_recv_bps = recv_bps
         self.state.host_metrics.updated_at = datetime.now()
+        self.state.metrics_rev += 1
+        self.state.updated.set()
 
-    @staticmethod
-    def _service_probe_url(service: ServiceEndpoint, base_url: str) -> str:
-        base = base_url.rstrip("/")
-        if service.name == "Sonarr":
-            return f"{base}/api/v3/system/status"
-        if service.name == "Radarr":
-            return f"{base}/api/v3/system/status"
-        if service.name == "Prowlarr":
-            return f"{base}/api/v1/system/status"
-        if service.name == "Plex":
-            return f"{base}/identity"
-        if service.name == "Home Assistant":
-            return f"{base}/api/"
-        return base
+
+_BYTE_UNITS = ("B/s", "KB/s", "MB/s", "GB/s", "TB/s")
 
 
 def human_bytes_per_second(value: float) -> str:
-    units = ["B/s", "KB/s", "MB/s", "GB/s"]
-    amount = float(value)
-    idx = 0
-    while amount >= 1024 and idx < len(units) - 1:
-        amount /= 1024
-        idx += 1
-    return f"{amount:,.1f} {units[idx]}"
+    amount = max(0.0, float(value))
+    # Each unit step is 2**10, so the unit index falls out of the bit length.
+    idx = (
+        0
+        if amount < 1024
+        else min(len(_BYTE_UNITS) - 1, (int(amount).bit_length() - 1) // 10)
+    )
+    return f"{amount / (1 << (10 * idx)):,.1f} {_BYTE_UNITS[idx]}"
 
 
 def human_seconds(seconds: float) -> str:
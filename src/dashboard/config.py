@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from urllib.parse import urlparse
 from dotenv import load_dotenv
 
@@ -24,7 +24,7 @@ def _normalize_tcp_host(value: str, default: str) -> str:
     return parsed.hostname or default
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ServiceEndpoint:
     name: str
     url: str
@@ -34,18 +34,24 @@ class ServiceEndpoint:
     probe_kind: str = "http"
     tcp_host: str = ""
     tcp_port: int = 0
+    interval_seconds: int = 5
+    phase_seconds: float = 0.0
+    probe_path: str = ""
+    local_probe_url: str = ""
+    remote_probe_url: str = ""
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class QbitConfig:
     url: str
     username: str
     password: str
+    fetch_limit: int = 50
 
 
 @dataclass(slots=True)
 class AppConfig:
-    services: list[ServiceEndpoint]
+    services: tuple[ServiceEndpoint, ...]
     qbit: QbitConfig
     refresh_metrics_seconds: int
     refresh_services_seconds: int
@@ -54,39 +60,57 @@ class AppConfig:
     enable_asciimatics: bool
 
 
+# Service-specific health endpoints, joined onto the base URLs once at
+# config time so probes never redo the string work per call.
+_PROBE_PATHS = {
+    "Sonarr": "/api/v3/system/status",
+    "Radarr": "/api/v3/system/status",
+    "Prowlarr": "/api/v1/system/status",
+    "Plex": "/identity",
+    "Home Assistant": "/api/",
+}
+
+
 def load_config() -> AppConfig:
     load_dotenv()
 
+    base_interval = max(2, _env_int("REFRESH_SERVICES_SECONDS", 5))
+
     services = [
         ServiceEndpoint(
             "Sonarr",
             os.getenv("SONARR_URL", "http://localhost:8989"),
             remote_url=os.getenv("SONARR_REMOTE_URL", "https://shows.razaq.dev"),
             api_key=os.getenv("SONARR_API_KEY", ""),
+            interval_seconds=base_interval,
         ),
         ServiceEndpoint(
             "Radarr",
             os.getenv("RADARR_URL", "http://localhost:7878"),
             remote_url=os.getenv("RADARR_REMOTE_URL", "https://movies.razaq.dev"),
             api_key=os.getenv("RADARR_API_KEY", ""),
+            interval_seconds=base_interval,
         ),
         ServiceEndpoint(
             "Plex",
             os.getenv("PLEX_URL", "http://localhost:32400"),
             remote_url=os.getenv("PLEX_REMOTE_URL", ""),
             token=os.getenv("PLEX_TOKEN", ""),
+            interval_seconds=max(base_interval, 10),
         ),
         ServiceEndpoint(
             "Home Assistant",
             os.getenv("HOMEASSISTANT_URL", "http://localhost:8123"),
             remote_url=os.getenv("HOMEASSISTANT_REMOTE_URL", "https://home.razaq.dev"),
             token=os.getenv("HOMEASSISTANT_TOKEN", ""),
+            interval_seconds=base_interval,
         ),
         ServiceEndpoint(
             "Prowlarr",
             os.getenv("PROWLARR_URL", "http://localhost:9696"),
             remote_url=os.getenv("PROWLARR_REMOTE_URL", "https://prowlarr.razaq.dev"),
             api_key=os.getenv("PROWLARR_API_KEY", ""),
+            interval_seconds=base_interval,
         ),
         ServiceEndpoint(
             "SSH",
@@ -96,13 +120,34 @@ def load_config() -> AppConfig:
                 os.getenv("SSH_URL", "ssh.razaq.dev"), "ssh.razaq.dev"
             ),
             tcp_port=max(1, _env_int("SSH_PORT", 22)),
+            interval_seconds=max(base_interval, 15),
         ),
     ]
 
+    # Stagger initial probes across the base period so the service checks
+    # never fire as one burst of simultaneous requests, and bake in the
+    # probe URLs. Endpoints are frozen, so derive final copies here.
+    services = tuple(
+        replace(
+            service,
+            phase_seconds=index * (base_interval / len(services)),
+            probe_path=_PROBE_PATHS.get(service.name, ""),
+            local_probe_url=service.url.rstrip("/")
+            + _PROBE_PATHS.get(service.name, ""),
+            remote_probe_url=(
+                service.remote_url.rstrip("/") + _PROBE_PATHS.get(service.name, "")
+                if service.remote_url.strip()
+                else ""
+            ),
+        )
+        for index, service in enumerate(services)
+    )
+
     qbit = QbitConfig(
         url=os.getenv("QBITTORRENT_URL", "http://localhost:8080"),
         username=os.getenv("QBITTORRENT_USERNAME", "admin"),
         password=os.getenv("QBITTORRENT_PASSWORD", "adminadmin"),
+        fetch_limit=max(1, _env_int("QBITTORRENT_FETCH_LIMIT", 50)),
     )
 
     motion_mode = os.getenv("MOTION_MODE", "normal").strip().lower()
@@ -113,7 +158,7 @@ def load_config() -> AppConfig:
         services=services,
         qbit=qbit,
         refresh_metrics_seconds=max(1, _env_int("REFRESH_METRICS_SECONDS", 1)),
-        refresh_services_seconds=max(2, _env_int("REFRESH_SERVICES_SECONDS", 5)),
+        refresh_services_seconds=base_interval,
         refresh_torrents_seconds=max(2, _env_int("REFRESH_TORRENTS_SECONDS", 3)),
         motion_mode=motion_mode,
         enable_asciimatics=os.getenv("ENABLE_ASCIIMATICS", "0").strip() == "1",
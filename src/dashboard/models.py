@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -11,18 +12,24 @@ class ServiceStatus:
     uptime_seconds: float = 0.0
     latency_ms: float = 0.0
     last_check: datetime | None = None
+    last_check_monotonic: float = 0.0
     error: str = ""
 
 
 @dataclass(slots=True)
-class TorrentItem:
-    name: str
-    progress: float
-    state: str
-    dlspeed: int
-    upspeed: int
-    eta_seconds: int
-    ratio: float
+class TorrentTable:
+    """Active torrents stored as parallel columns instead of per-item objects."""
+
+    names: list[str] = field(default_factory=list)
+    progress: list[float] = field(default_factory=list)
+    states: list[str] = field(default_factory=list)
+    dlspeed: list[int] = field(default_factory=list)
+    upspeed: list[int] = field(default_factory=list)
+    eta_seconds: list[int] = field(default_factory=list)
+    ratio: list[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.names)
 
 
 @dataclass(slots=True)
@@ -37,6 +44,10 @@ class HostMetrics:
 @dataclass(slots=True)
 class DashboardState:
     services: dict[str, ServiceStatus] = field(default_factory=dict)
-    torrents: list[TorrentItem] = field(default_factory=list)
+    torrents: TorrentTable = field(default_factory=TorrentTable)
     host_metrics: HostMetrics = field(default_factory=HostMetrics)
     motion_mode: str = "normal"
+    services_rev: int = 0
+    torrents_rev: int = 0
+    metrics_rev: int = 0
+    updated: asyncio.Event = field(default_factory=asyncio.Event)
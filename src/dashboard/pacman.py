@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import random
+from bisect import bisect_right
 from dataclasses import dataclass
+from itertools import accumulate
 from typing import Literal
 
 from textual.app import ComposeResult
@@ -10,7 +12,11 @@ from textual.containers import Container
 from textual.screen import ModalScreen, Screen
 from textual.widgets import Static
 
-Direction = Literal["up", "down", "left", "right"]
+# Directions are small ints so deltas and reverses are tuple indexing and
+# per-ghost state packs into plain machine words.
+Direction = int
+UP, LEFT, DOWN, RIGHT = range(4)
+
 GhostMode = Literal["home", "scatter", "chase", "frightened", "eaten"]
 
 
@@ -23,10 +29,15 @@ class Ghost:
     home_y: int
     color: str
     mode: GhostMode = "home"
-    direction: Direction = "left"
+    direction: Direction = LEFT
     released: bool = False
     frightened_ticks: int = 0
     release_tick: int = 0
+    scatter_target: tuple[int, int] = (0, 0)
+    styled_glyph: str = ""
+
+    def __post_init__(self) -> None:
+        self.styled_glyph = f"[bold {self.color}]ᗣ[/]"
 
 
 LEVEL = [
@@ -54,12 +65,55 @@ LEVEL = [
     "############################",
 ]
 
-WALL = "#"
-PELLET = "."
-POWER = "o"
-HOUSE = "H"
-GATE = "="
-EMPTY = " "
+# Tiles are stored as raw byte values so map rows can be bytearrays and
+# tile tests become integer compares.
+WALL = ord("#")
+PELLET = ord(".")
+POWER = ord("o")
+HOUSE = ord("H")
+GATE = ord("=")
+EMPTY = ord(" ")
+
+_LEVEL_BYTES = tuple(row.encode("ascii") for row in LEVEL)
+_LEVEL_FLAT = b"".join(_LEVEL_BYTES)
+_INITIAL_PELLETS = _LEVEL_FLAT.count(PELLET) + _LEVEL_FLAT.count(POWER)
+
+# Indexed by direction code.
+_DELTA: tuple[tuple[int, int], ...] = ((0, -1), (-1, 0), (0, 1), (1, 0))
+_REVERSE: tuple[Direction, ...] = (DOWN, RIGHT, UP, LEFT)
+# Fully-styled player glyphs, indexed by direction code for the open
+# mouth; the closed-mouth frame is direction-independent.
+_PAC_OPEN: tuple[str, ...] = tuple(
+    f"[bold #ffdd66]{glyph}[/]" for glyph in ("ᗢ", "ᗤ", "ᗣ", "ᗧ")
+)
+_PAC_CLOSED = "[bold #ffdd66]●[/]"
+
+# Approximate classic scatter/chase schedule (ticks at 0.12 s):
+# 7s,20s,7s,20s,5s,20s,5s, then chase for the rest of the level. Stored
+# as prefix sums so the current phase falls out of one bisect on the
+# tick counter — even phases scatter, odd phases chase.
+_MODE_PREFIX: tuple[int, ...] = tuple(accumulate((58, 166, 58, 166, 42, 166, 42)))
+
+
+def _build_style_table() -> tuple[str, ...]:
+    # Length-256 table mapping a raw tile byte straight to its styled
+    # glyph, replacing a branch ladder per cell when base rows rebuild.
+    table = [" "] * 256
+    table[WALL] = "[bold #69549e]█[/]"
+    table[HOUSE] = "[#2a213f]▒[/]"
+    table[GATE] = "[bold #9f8ad9]═[/]"
+    table[PELLET] = "[#c9b8ee]·[/]"
+    table[POWER] = "[bold #ffffff]◉[/]"
+    return tuple(table)
+
+
+_STYLE_TABLE = _build_style_table()
+
+# Remaining per-tick sprite markup, hoisted like the player glyphs.
+_FRUIT_GLYPH = "[bold #ff5d8f]◆[/]"
+_GHOST_EATEN = "[bold #d9d9ff]◌[/]"
+_GHOST_FRIGHT_BLUE = "[bold #5f90ff]ᗣ[/]"
+_GHOST_FRIGHT_WHITE = "[bold #ffffff]ᗣ[/]"
 
 
 class CommandMenuScreen(ModalScreen[None]):
@@ -111,21 +165,23 @@ class PacmanScreen(Screen[None]):
 
     def __init__(self) -> None:
         super().__init__()
-        self.map = [list(row) for row in LEVEL]
-        self.height = len(self.map)
-        self.width = len(self.map[0])
+        # The maze lives in one flat bytearray indexed y * width + x, so a
+        # tile read is a single indexed load instead of two list hops.
+        self._map_flat = bytearray(_LEVEL_FLAT)
+        self.height = len(_LEVEL_BYTES)
+        self.width = len(_LEVEL_BYTES[0])
 
         self.player_x = 14
         self.player_y = 16
-        self.player_dir: Direction = "left"
-        self.next_dir: Direction = "left"
+        self.player_dir: Direction = LEFT
+        self.next_dir: Direction = LEFT
 
         self.ghosts: list[Ghost] = []
         self._init_ghosts()
+        self._rng = random.Random()
+        self._ghost_at: dict[tuple[int, int], Ghost] = {}
 
         self.tick = 0
-        self.mode_timer = 0
-        self.mode_cycle_index = 0
         self.global_mode: Literal["scatter", "chase"] = "scatter"
 
         self.fruit_pos = (14, 10)
@@ -141,7 +197,6 @@ class PacmanScreen(Screen[None]):
         self.level_cleared = False
         self._mouth_open = True
         self._pellet_count = 0
-        self._initial_pellet_count = 0
 
     def compose(self) -> ComposeResult:
         with Container(id="pacman_root"):
@@ -153,6 +208,9 @@ class PacmanScreen(Screen[None]):
             )
 
     def on_mount(self) -> None:
+        # query_one walks the DOM; resolve the per-tick widgets once.
+        self._score_widget = self.query_one("#pacman_score", Static)
+        self._canvas_widget = self.query_one("#pacman_canvas", Static)
         self._reset_level(reset_score=False)
         self._render_board()
         self.set_interval(0.12, self._game_tick)
@@ -165,16 +223,16 @@ class PacmanScreen(Screen[None]):
         self._render_board()
 
     def action_move_up(self) -> None:
-        self.next_dir = "up"
+        self.next_dir = UP
 
     def action_move_down(self) -> None:
-        self.next_dir = "down"
+        self.next_dir = DOWN
 
     def action_move_left(self) -> None:
-        self.next_dir = "left"
+        self.next_dir = LEFT
 
     def action_move_right(self) -> None:
-        self.next_dir = "right"
+        self.next_dir = RIGHT
 
     def _init_ghosts(self) -> None:
         self.ghosts = [
@@ -188,22 +246,49 @@ class PacmanScreen(Screen[None]):
                 mode="chase",
                 released=True,
                 release_tick=0,
+                scatter_target=(self.width - 2, 1),
+            ),
+            Ghost(
+                "Pinky",
+                13,
+                10,
+                13,
+                10,
+                "#ff89d0",
+                release_tick=40,
+                scatter_target=(1, 1),
+            ),
+            Ghost(
+                "Inky",
+                14,
+                9,
+                14,
+                9,
+                "#5fd8ff",
+                release_tick=90,
+                scatter_target=(self.width - 2, self.height - 2),
+            ),
+            Ghost(
+                "Clyde",
+                15,
+                10,
+                15,
+                10,
+                "#ffb36b",
+                release_tick=140,
+                scatter_target=(1, self.height - 2),
             ),
-            Ghost("Pinky", 13, 10, 13, 10, "#ff89d0", release_tick=40),
-            Ghost("Inky", 14, 9, 14, 9, "#5fd8ff", release_tick=90),
-            Ghost("Clyde", 15, 10, 15, 10, "#ffb36b", release_tick=140),
         ]
+        self._blinky = self.ghosts[0]
 
     def _reset_level(self, reset_score: bool) -> None:
-        self.map = [list(row) for row in LEVEL]
+        self._map_flat = bytearray(_LEVEL_FLAT)
         self.player_x = 14
         self.player_y = 16
-        self.player_dir = "left"
-        self.next_dir = "left"
+        self.player_dir = LEFT
+        self.next_dir = LEFT
         self._init_ghosts()
         self.tick = 0
-        self.mode_timer = 0
-        self.mode_cycle_index = 0
         self.global_mode = "scatter"
         self.fruit_visible = False
         self.fruit_ticks_left = 0
@@ -213,10 +298,17 @@ class PacmanScreen(Screen[None]):
         self.game_over = False
         self.level_cleared = False
         self._mouth_open = True
-        self._pellet_count = sum(
-            row.count(PELLET) + row.count(POWER) for row in self.map
-        )
-        self._initial_pellet_count = self._pellet_count
+        self._pellet_count = _INITIAL_PELLETS
+        width = self.width
+        self._base_rows = [
+            [_STYLE_TABLE[tile] for tile in self._map_flat[y * width : (y + 1) * width]]
+            for y in range(self.height)
+        ]
+        self._base_row_strings = ["".join(row) for row in self._base_rows]
+        self._row_cache = list(self._base_row_strings)
+        self._overlay_buf: list[str | None] = [None] * (self.width * self.height)
+        self._prev_overlay_idx: list[int] = []
+        self._build_move_tables()
         if reset_score:
             self.score = 0
             self.lives = 3
@@ -237,13 +329,8 @@ class PacmanScreen(Screen[None]):
         self._render_board()
 
     def _update_global_mode(self) -> None:
-        # Approximate classic schedule (in ticks at 0.12 sec): 7s,20s,7s,20s,5s,20s,5s,inf
-        schedule = [58, 166, 58, 166, 42, 166, 42, 99999]
-        self.mode_timer += 1
-        if self.mode_timer >= schedule[min(self.mode_cycle_index, len(schedule) - 1)]:
-            self.mode_timer = 0
-            self.mode_cycle_index = min(self.mode_cycle_index + 1, len(schedule) - 1)
-            self.global_mode = "chase" if self.global_mode == "scatter" else "scatter"
+        phase = bisect_right(_MODE_PREFIX, self.tick)
+        self.global_mode = "chase" if phase & 1 else "scatter"
 
     def _move_player(self) -> None:
         if self._can_move(self.player_x, self.player_y, self.next_dir, is_ghost=False):
@@ -252,26 +339,30 @@ class PacmanScreen(Screen[None]):
         if self._can_move(
             self.player_x, self.player_y, self.player_dir, is_ghost=False
         ):
-            dx, dy = self._dir_delta(self.player_dir)
+            dx, dy = _DELTA[self.player_dir]
             self.player_x += dx
             self.player_y += dy
             self._wrap_player()
 
         tile = self._tile(self.player_x, self.player_y)
         if tile == PELLET:
-            self.map[self.player_y][self.player_x] = EMPTY
+            self._consume_tile(self.player_x, self.player_y)
             self.score += 10
-            self._pellet_count -= 1
         elif tile == POWER:
-            self.map[self.player_y][self.player_x] = EMPTY
+            self._consume_tile(self.player_x, self.player_y)
             self.score += 50
-            self._pellet_count -= 1
             self.ghost_combo = 0
             for ghost in self.ghosts:
                 if ghost.mode not in {"home", "eaten"}:
                     ghost.mode = "frightened"
                     ghost.frightened_ticks = 75
 
+    def _consume_tile(self, x: int, y: int) -> None:
+        self._map_flat[y * self.width + x] = EMPTY
+        self._pellet_count -= 1
+        self._base_rows[y][x] = " "
+        self._base_row_strings[y] = "".join(self._base_rows[y])
+
     def _move_ghosts(self) -> None:
         for ghost in self.ghosts:
             if not ghost.released:
@@ -289,7 +380,7 @@ class PacmanScreen(Screen[None]):
             if ghost.mode == "eaten":
                 target = (ghost.home_x, ghost.home_y)
             elif ghost.mode == "scatter":
-                target = self._scatter_target(ghost.name)
+                target = ghost.scatter_target
             elif ghost.mode == "chase":
                 target = self._chase_target(ghost)
             elif ghost.mode == "frightened":
@@ -309,35 +400,53 @@ class PacmanScreen(Screen[None]):
                 ghost.mode = self.global_mode
                 ghost.frightened_ticks = 0
 
-    def _step_ghost_toward(self, ghost: Ghost, target: tuple[int, int]) -> None:
-        options: list[tuple[int, int, Direction, int]] = []
-        reverse_dir = self._reverse_dir(ghost.direction)
-        for direction in ["up", "left", "down", "right"]:
-            if ghost.mode != "frightened" and direction == reverse_dir:
-                continue
-            if not self._can_move(ghost.x, ghost.y, direction, is_ghost=True):
-                continue
-            dx, dy = self._dir_delta(direction)
-            nx, ny = ghost.x + dx, ghost.y + dy
-            dist = abs(target[0] - nx) + abs(target[1] - ny)
-            options.append((nx, ny, direction, dist))
+        # Spatial hash over ghost cells; the collision pass probes it once.
+        ghost_at = self._ghost_at
+        ghost_at.clear()
+        for ghost in self.ghosts:
+            ghost_at[(ghost.x, ghost.y)] = ghost
 
-        if not options:
-            return
+    def _step_ghost_toward(self, ghost: Ghost, target: tuple[int, int]) -> None:
+        gx, gy = ghost.x, ghost.y
 
         if ghost.mode == "frightened":
-            nx, ny, direction, _ = random.choice(options)
+            # Reversing is allowed while frightened; pick any legal move.
+            options: list[tuple[int, int, Direction]] = []
+            for direction in (UP, LEFT, DOWN, RIGHT):
+                if not self._can_move(gx, gy, direction, is_ghost=True):
+                    continue
+                dx, dy = _DELTA[direction]
+                options.append((gx + dx, gy + dy, direction))
+            if not options:
+                return
+            nx, ny, direction = options[self._rng.getrandbits(2) % len(options)]
         else:
-            options.sort(key=lambda item: item[3])
-            nx, ny, direction, _ = options[0]
+            # Single-pass argmin over at most four candidates; ties keep
+            # the first hit in UP/LEFT/DOWN/RIGHT order, like the old sort.
+            reverse_dir = _REVERSE[ghost.direction]
+            tx, ty = target
+            best = None
+            best_dist = 1 << 30
+            for direction in (UP, LEFT, DOWN, RIGHT):
+                if direction == reverse_dir:
+                    continue
+                if not self._can_move(gx, gy, direction, is_ghost=True):
+                    continue
+                dx, dy = _DELTA[direction]
+                nx, ny = gx + dx, gy + dy
+                dist = abs(tx - nx) + abs(ty - ny)
+                if dist < best_dist:
+                    best_dist = dist
+                    best = (nx, ny, direction)
+            if best is None:
+                return
+            nx, ny, direction = best
 
         ghost.x, ghost.y = nx, ny
         ghost.direction = direction
 
     def _update_fruit(self) -> None:
-        if not self._initial_pellet_count:
-            return
-        ratio = self._pellet_count / self._initial_pellet_count
+        ratio = self._pellet_count / _INITIAL_PELLETS
 
         if not self._fruit_spawned_once and ratio <= 0.70:
             self._spawn_fruit()
@@ -359,6 +468,11 @@ class PacmanScreen(Screen[None]):
         self.fruit_ticks_left = 80
 
     def _resolve_collisions(self) -> None:
+        # Broad phase: one hash probe settles the common no-contact tick.
+        # Only on a hit does the exact scan run, which also handles the
+        # rare stack of several ghosts on the player's cell.
+        if (self.player_x, self.player_y) not in self._ghost_at:
+            return
         for ghost in self.ghosts:
             if (ghost.x, ghost.y) != (self.player_x, self.player_y):
                 continue
@@ -376,15 +490,15 @@ class PacmanScreen(Screen[None]):
     def _reset_after_death(self) -> None:
         self.player_x = 14
         self.player_y = 16
-        self.player_dir = "left"
-        self.next_dir = "left"
+        self.player_dir = LEFT
+        self.next_dir = LEFT
         self.ghost_combo = 0
         for ghost in self.ghosts:
             ghost.x = ghost.home_x
             ghost.y = ghost.home_y
             ghost.mode = "home"
             ghost.released = False
-            ghost.direction = "left"
+            ghost.direction = LEFT
             ghost.frightened_ticks = 0
         if self.ghosts:
             self.ghosts[0].released = True
@@ -395,23 +509,36 @@ class PacmanScreen(Screen[None]):
             self.level_cleared = True
             self.game_over = True
 
-    def _can_move(self, x: int, y: int, direction: Direction, is_ghost: bool) -> bool:
-        dx, dy = self._dir_delta(direction)
-        nx, ny = x + dx, y + dy
+    def _build_move_tables(self) -> None:
+        # Walls and gates never change, so legality of every (cell,
+        # direction) move is baked into two flat bitmaps once per reset;
+        # _can_move becomes a single indexed load.
+        width, height = self.width, self.height
+        player = bytearray(width * height * 4)
+        ghost = bytearray(width * height * 4)
+        for y in range(height):
+            for x in range(width):
+                base = (y * width + x) * 4
+                for direction, (dx, dy) in enumerate(_DELTA):
+                    nx, ny = x + dx, y + dy
+                    # player tunnel wrap openings
+                    if ny == 10 and (nx < 0 or nx >= width):
+                        player[base + direction] = 1
+                        continue
+                    if ny < 0 or ny >= height or nx < 0 or nx >= width:
+                        continue
+                    tile = self._map_flat[ny * width + nx]
+                    if tile == WALL:
+                        continue
+                    ghost[base + direction] = 1
+                    if tile != GATE:
+                        player[base + direction] = 1
+        self._can_move_player = bytes(player)
+        self._can_move_ghost = bytes(ghost)
 
-        # player tunnel wrap openings
-        if not is_ghost and ny == 10 and (nx < 0 or nx >= self.width):
-            return True
-
-        if ny < 0 or ny >= self.height or nx < 0 or nx >= self.width:
-            return False
-
-        tile = self.map[ny][nx]
-        if tile == WALL:
-            return False
-        if tile == GATE and not is_ghost:
-            return False
-        return True
+    def _can_move(self, x: int, y: int, direction: Direction, is_ghost: bool) -> bool:
+        table = self._can_move_ghost if is_ghost else self._can_move_player
+        return bool(table[(y * self.width + x) * 4 + direction])
 
     def _wrap_player(self) -> None:
         if self.player_y == 10 and self.player_x < 0:
@@ -419,48 +546,18 @@ class PacmanScreen(Screen[None]):
         elif self.player_y == 10 and self.player_x >= self.width:
             self.player_x = 0
 
-    @staticmethod
-    def _dir_delta(direction: Direction) -> tuple[int, int]:
-        if direction == "up":
-            return (0, -1)
-        if direction == "down":
-            return (0, 1)
-        if direction == "left":
-            return (-1, 0)
-        return (1, 0)
-
-    @staticmethod
-    def _reverse_dir(direction: Direction) -> Direction:
-        return {
-            "up": "down",
-            "down": "up",
-            "left": "right",
-            "right": "left",
-        }[
-            direction
-        ]  # type: ignore[return-value]
-
-    def _scatter_target(self, ghost_name: str) -> tuple[int, int]:
-        targets = {
-            "Blinky": (self.width - 2, 1),
-            "Pinky": (1, 1),
-            "Inky": (self.width - 2, self.height - 2),
-            "Clyde": (1, self.height - 2),
-        }
-        return targets.get(ghost_name, (self.width - 2, 1))
-
     def _chase_target(self, ghost: Ghost) -> tuple[int, int]:
         if ghost.name == "Blinky":
             return (self.player_x, self.player_y)
 
         px, py = self.player_x, self.player_y
-        dx, dy = self._dir_delta(self.player_dir)
+        dx, dy = _DELTA[self.player_dir]
 
         if ghost.name == "Pinky":
             return (px + dx * 4, py + dy * 4)
 
         if ghost.name == "Inky":
-            blinky = self.ghosts[0]
+            blinky = self._blinky
             ax, ay = (px + dx * 2, py + dy * 2)
             vx, vy = (ax - blinky.x, ay - blinky.y)
             return (ax + vx, ay + vy)
@@ -469,61 +566,72 @@ class PacmanScreen(Screen[None]):
         distance = abs(ghost.x - px) + abs(ghost.y - py)
         if distance > 8:
             return (px, py)
-        return self._scatter_target("Clyde")
+        return ghost.scatter_target
 
     def _random_target(self) -> tuple[int, int]:
-        return (random.randint(1, self.width - 2), random.randint(1, self.height - 2))
+        rng = self._rng
+        return (rng.randrange(1, self.width - 1), rng.randrange(1, self.height - 1))
 
-    def _tile(self, x: int, y: int) -> str:
+    def _tile(self, x: int, y: int) -> int:
         if y < 0 or y >= self.height or x < 0 or x >= self.width:
             return WALL
-        return self.map[y][x]
+        return self._map_flat[y * self.width + x]
 
     def _render_board(self) -> None:
-        overlays: dict[tuple[int, int], str] = {}
+        # Sprites live in a persistent flat buffer indexed by y*width+x;
+        # only previously-set slots are cleared, so there is no per-tick
+        # dict or tuple-key hashing. Fruit goes in first so the sprites
+        # below win a shared cell.
+        width = self.width
+        buf = self._overlay_buf
+        for idx in self._prev_overlay_idx:
+            buf[idx] = None
+
+        new_idx: list[int] = []
+        if self.fruit_visible:
+            fx, fy = self.fruit_pos
+            idx = fy * width + fx
+            buf[idx] = _FRUIT_GLYPH
+            new_idx.append(idx)
         for ghost in self.ghosts:
-            glyph = "ᗣ"
-            color = ghost.color
-            if ghost.mode == "frightened":
-                color = (
-                    "#5f90ff"
+            if ghost.mode == "eaten":
+                cell = _GHOST_EATEN
+            elif ghost.mode == "frightened":
+                cell = (
+                    _GHOST_FRIGHT_BLUE
                     if ghost.frightened_ticks > 20
-                    else ("#ffffff" if self.tick % 4 < 2 else "#5f90ff")
+                    else (
+                        _GHOST_FRIGHT_WHITE
+                        if self.tick % 4 < 2
+                        else _GHOST_FRIGHT_BLUE
+                    )
                 )
-            if ghost.mode == "eaten":
-                glyph = "◌"
-                color = "#d9d9ff"
-            overlays[(ghost.x, ghost.y)] = f"[bold {color}]{glyph}[/]"
-
-        overlays[(self.player_x, self.player_y)] = (
-            f"[bold #ffdd66]{self._pacman_glyph()}[/]"
-        )
-
-        rows: list[str] = []
-        for y in range(self.height):
-            chars: list[str] = []
-            for x in range(self.width):
-                if (x, y) in overlays:
-                    chars.append(overlays[(x, y)])
-                    continue
-
-                base = self.map[y][x]
-                if base == WALL:
-                    chars.append("[bold #69549e]█[/]")
-                elif base == HOUSE:
-                    chars.append("[#2a213f]▒[/]")
-                elif base == GATE:
-                    chars.append("[bold #9f8ad9]═[/]")
-                elif base == PELLET:
-                    chars.append("[#c9b8ee]·[/]")
-                elif base == POWER:
-                    chars.append("[bold #ffffff]◉[/]")
-                elif self.fruit_visible and (x, y) == self.fruit_pos:
-                    chars.append("[bold #ff5d8f]◆[/]")
-                else:
-                    chars.append(" ")
-
-            rows.append("".join(chars))
+            else:
+                cell = ghost.styled_glyph
+            idx = ghost.y * width + ghost.x
+            buf[idx] = cell
+            new_idx.append(idx)
+
+        idx = self.player_y * width + self.player_x
+        buf[idx] = _PAC_OPEN[self.player_dir] if self._mouth_open else _PAC_CLOSED
+        new_idx.append(idx)
+
+        # Only rows touched by a sprite this tick or last tick can have
+        # changed; everything else reuses its cached string.
+        dirty_rows = {i // width for i in new_idx}
+        dirty_rows.update(i // width for i in self._prev_overlay_idx)
+        self._prev_overlay_idx = new_idx
+
+        for y in dirty_rows:
+            cells = [i for i in new_idx if i // width == y]
+            if not cells:
+                self._row_cache[y] = self._base_row_strings[y]
+            else:
+                row = self._base_rows[y][:]
+                start = y * width
+                for i in cells:
+                    row[i - start] = buf[i]
+                self._row_cache[y] = "".join(row)
 
         if self.level_cleared:
             score_text = f"[bold #8df7b0]Level Clear![/] • Score: [bold #e7dcff]{self.score}[/] • Press Enter to restart"
@@ -543,15 +651,5 @@ class PacmanScreen(Screen[None]):
                 f"Mode [bold #e7dcff]{mode_text}[/] {fruit_text}"
             )
 
-        self.query_one("#pacman_score", Static).update(score_text)
-        self.query_one("#pacman_canvas", Static).update("\n".join(rows))
-
-    def _pacman_glyph(self) -> str:
-        if not self._mouth_open:
-            return "●"
-        return {
-            "left": "ᗤ",
-            "right": "ᗧ",
-            "up": "ᗢ",
-            "down": "ᗣ",
-        }[self.player_dir]
+        self._score_widget.update(score_text)
+        self._canvas_widget.update("\n".join(self._row_cache))
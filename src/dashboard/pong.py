@@ -54,8 +54,12 @@ class PongScreen(Screen[None]):
 
     def on_mount(self) -> None:
         self._mounted = True
+        # query_one walks the DOM; resolve the per-tick widgets once.
+        self._score_widget = self.query_one("#pong_score", Static)
+        self._canvas_widget = self.query_one("#pong_canvas", Static)
         self._fit_to_canvas()
         self._sync_geometry()
+        self._rebuild_grid()
         self._reset_ball()
         self._start_timer()
         self._draw_board()
@@ -65,6 +69,7 @@ class PongScreen(Screen[None]):
             return
         if self._fit_to_canvas():
             self._sync_geometry()
+            self._rebuild_grid()
             self._reset_ball()
         self._draw_board()
 
@@ -85,7 +90,7 @@ class PongScreen(Screen[None]):
         self._draw_board()
 
     def _fit_to_canvas(self) -> bool:
-        canvas = self.query_one("#pong_canvas", Static)
+        canvas = self._canvas_widget
         canvas_w = max(1, canvas.size.width)
         canvas_h = max(1, canvas.size.height)
         new_width = max(20, canvas_w // self.cell_width)
@@ -96,6 +101,26 @@ class PongScreen(Screen[None]):
             self.height = new_height
         return changed
 
+    def _rebuild_grid(self) -> None:
+        # The board grid persists between frames; each draw touches only the
+        # handful of cells a sprite left or entered, so rebuilding the whole
+        # width x height surface happens on resize alone.
+        center = self.width // 2
+        self._grid = [[" "] * self.width for _ in range(self.height)]
+        for y in range(self.height):
+            self._grid[y][center] = "·"
+        self._row_strings = [""] * self.height
+        self._dirty_rows = set(range(self.height))
+        self._prev_cells: list[tuple[int, int]] = []
+        # The palette is fixed, so every styled cell string is an invariant
+        # of cell_width — build the four variants once here instead of
+        # formatting markup per cell per frame.
+        cw = self.cell_width
+        self._s_bg = " " * cw
+        self._s_paddle = f"[on #b4ff8a]{self._s_bg}[/]"
+        self._s_ball = f"[on #ffd783]{self._s_bg}[/]"
+        self._s_center = f"[on #2e2548 #6f5aa5]{('·' + self._s_bg)[:cw]}[/]"
+
     def _sync_geometry(self) -> None:
         self.left_x = max(1, min(self.left_x, self.width - 2))
         self.right_x = max(self.left_x + 2, self.width - 3)
@@ -105,7 +130,7 @@ class PongScreen(Screen[None]):
     def _start_timer(self) -> None:
         if self._timer is not None:
             self._timer.stop()
-        self._timer = self.set_interval(0.05, self._tick)  # 20 FPS
+        self._timer = self.set_interval(0.1, self._tick)  # 10 FPS, 2 physics sub-steps
 
     def _reset_ball(self) -> None:
         self.ball_x = self.width / 2
@@ -115,17 +140,26 @@ class PongScreen(Screen[None]):
 
     def _tick(self) -> None:
         if self.paused:
-            self._draw_board()
+            # action_pause already drew the frozen frame; nothing moves.
             return
 
+        # Two half-speed sub-steps keep the trajectory and collision checks
+        # at the old 20 Hz granularity while halving timer wakeups.
+        if self._step(0.5):
+            self._step(0.5)
+        self._draw_board()
+
+    def _step(self, scale: float) -> bool:
+        """Advance one physics sub-step; returns False when a point ended it."""
         left_target = self._predict_intercept(self.left_x + 1)
         right_target = self._predict_intercept(self.right_x - 1)
 
-        self.left_y = self._move_toward(self.left_y, left_target, self.paddle_speed)
-        self.right_y = self._move_toward(self.right_y, right_target, self.paddle_speed)
+        speed = self.paddle_speed * scale
+        self.left_y = self._move_toward(self.left_y, left_target, speed)
+        self.right_y = self._move_toward(self.right_y, right_target, speed)
 
-        next_x = self.ball_x + self.ball_vx
-        next_y = self.ball_y + self.ball_vy
+        next_x = self.ball_x + self.ball_vx * scale
+        next_y = self.ball_y + self.ball_vy * scale
 
         if next_y <= 0:
             next_y = -next_y
@@ -170,39 +204,31 @@ class PongScreen(Screen[None]):
             self.rally_hits = 0
             self.ball_vx = abs(self.ball_vx)
             self._reset_ball()
-            self._draw_board()
-            return
+            return False
         if next_x > self.width - 1:
             self.left_score += 1
             self.rally_hits = 0
             self.ball_vx = -abs(self.ball_vx)
             self._reset_ball()
-            self._draw_board()
-            return
+            return False
 
         self.ball_x = next_x
         self.ball_y = next_y
-        self._draw_board()
+        return True
 
     def _predict_intercept(self, target_x: int) -> float:
-        x = self.ball_x
-        y = self.ball_y
+        # Wall bounces fold the ball's straight-line path into a triangle
+        # wave, so the intercept is closed form — no step-by-step simulation.
         vx = self.ball_vx
-        vy = self.ball_vy
-
-        # Simulate ahead with bounce handling until reaching x target.
-        for _ in range(1000):
-            if (vx > 0 and x >= target_x) or (vx < 0 and x <= target_x):
-                return y
-            x += vx
-            y += vy
-            if y <= 0:
-                y = -y
-                vy *= -1
-            elif y >= self.height - 1:
-                y = 2 * (self.height - 1) - y
-                vy *= -1
-        return self.height / 2
+        if vx == 0:
+            return self.height / 2
+        dt = (target_x - self.ball_x) / vx
+        if dt < 0:
+            return self.height / 2
+        raw = self.ball_y + self.ball_vy * dt
+        period = 2 * (self.height - 1)
+        folded = raw % period
+        return folded if folded <= self.height - 1 else period - folded
 
     @staticmethod
     def _move_toward(current: float, target: float, max_step: float) -> float:
@@ -213,10 +239,12 @@ class PongScreen(Screen[None]):
 
     def _draw_board(self) -> None:
         self._sync_geometry()
-        grid = [[" " for _ in range(self.width)] for _ in range(self.height)]
-
-        for y in range(self.height):
-            grid[y][self.width // 2] = "·"
+        grid = self._grid
+        center = self.width // 2
+        dirty = self._dirty_rows
+        for px, py in self._prev_cells:
+            grid[py][px] = "·" if px == center else " "
+            dirty.add(py)
 
         half = self.paddle_height // 2
         left_center = int(round(self.left_y))
@@ -229,29 +257,45 @@ class PongScreen(Screen[None]):
         left_col = max(0, min(self.width - 1, self.left_x))
         right_col = max(0, min(self.width - 1, self.right_x))
 
+        cells: list[tuple[int, int]] = []
         for y in range(left_top, left_bottom + 1):
             grid[y][left_col] = "█"
+            cells.append((left_col, y))
         for y in range(right_top, right_bottom + 1):
             grid[y][right_col] = "█"
+            cells.append((right_col, y))
 
         bx = max(0, min(self.width - 1, int(round(self.ball_x))))
         by = max(0, min(self.height - 1, int(round(self.ball_y))))
         grid[by][bx] = "■"
+        cells.append((bx, by))
 
-        lines = []
-        for row in grid:
+        for _, y in cells:
+            dirty.add(y)
+        self._prev_cells = cells
+
+        s_paddle, s_ball, s_center, s_bg = (
+            self._s_paddle,
+            self._s_ball,
+            self._s_center,
+            self._s_bg,
+        )
+        for y in dirty:
             styled_cells = []
-            for ch in row:
+            for ch in grid[y]:
                 if ch == "█":
-                    styled_cells.append(self._cell("#b4ff8a"))
+                    styled_cells.append(s_paddle)
                 elif ch == "■":
-                    styled_cells.append(self._cell("#ffd783"))
+                    styled_cells.append(s_ball)
                 elif ch == "·":
-                    styled_cells.append(self._cell("#2e2548", "·", "#6f5aa5"))
+                    styled_cells.append(s_center)
                 else:
-                    styled_cells.append(" " * self.cell_width)
+                    styled_cells.append(s_bg)
+            self._row_strings[y] = "".join(styled_cells)
+        dirty.clear()
 
-            row_text = "".join(styled_cells)
+        lines = []
+        for row_text in self._row_strings:
             for _ in range(self.cell_height):
                 lines.append(row_text)
 
@@ -265,14 +309,5 @@ class PongScreen(Screen[None]):
             f"{state}"
         )
 
-        self.query_one("#pong_score", Static).update(score_text)
-        self.query_one("#pong_canvas", Static).update("\n".join(lines))
-
-    def _cell(
-        self, background: str, symbol: str = "", foreground: str = "#101010"
-    ) -> str:
-        symbol = symbol[:1]
-        body = (symbol + " " * self.cell_width)[: self.cell_width]
-        if symbol:
-            return f"[on {background} {foreground}]{body}[/]"
-        return f"[on {background}]{body}[/]"
+        self._score_widget.update(score_text)
+        self._canvas_widget.update("\n".join(lines))
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import random
+import time
+from collections import deque
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -10,6 +12,12 @@ from textual.containers import Container
 from textual.screen import Screen
 from textual.widgets import Static
 
+# Cell-type codes for the render grid. The grid itself is a flat
+# bytearray indexed by the packed cell int, so marking a cell dirty and
+# repainting it are raw byte writes; the codes index _cell_strings when
+# a row is rejoined.
+EMPTY, HEAD, BODY, OBSTACLE, FOOD, SPECIAL_A, SPECIAL_B = range(7)
+
 
 class SnakeScreen(Screen[None]):
     BINDINGS = [
@@ -31,14 +39,25 @@ class SnakeScreen(Screen[None]):
         self.cell_height = 2
         self.tick_seconds = 0.11
 
-        self.snake: list[tuple[int, int]] = []
+        # A deque makes the per-tick head prepend O(1); list.insert(0, ...)
+        # shifts the whole body every move. Cells are packed ints
+        # (y * width + x): native int hashing beats tuple hashing in the
+        # sets, and each cell is a fraction of a 2-tuple's footprint.
+        # Coordinates are only unpacked via divmod at the board edges
+        # and when painting.
+        self.snake: deque[int] = deque()
         self.direction = (1, 0)
         self.next_direction = (1, 0)
-        self.food = (0, 0)
-        self.special_food: tuple[int, int] | None = None
+        self.food = 0
+        self.special_food: int | None = None
         self.special_food_ticks = 0
         self.special_food_cooldown = 0
-        self.obstacles: set[tuple[int, int]] = set()
+        self.obstacles: frozenset[int] = frozenset()
+        # Ring layout is a pure function of the board size; restarts on
+        # an unchanged board reuse the frozen set and row index.
+        self._obstacle_cache: dict[
+            tuple[int, int], tuple[frozenset[int], dict[int, frozenset[int]]]
+        ] = {}
 
         self.score = 0
         self.high_score = 0
@@ -48,7 +67,9 @@ class SnakeScreen(Screen[None]):
         self.paused = False
 
         self._timer = None
+        self._render_dirty = False
         self._high_score_path = self._resolve_high_score_path()
+        self._high_score_dirty = False
         self._mounted = False
 
     def compose(self) -> ComposeResult:
@@ -62,6 +83,9 @@ class SnakeScreen(Screen[None]):
 
     def on_mount(self) -> None:
         self._mounted = True
+        # query_one walks the DOM; resolve the per-tick widgets once.
+        self._score_widget = self.query_one("#snake_score", Static)
+        self._canvas_widget = self.query_one("#snake_canvas", Static)
         self.high_score = self._load_high_score()
         self._fit_board_to_canvas()
         self._reset_game(reset_score=True)
@@ -74,8 +98,12 @@ class SnakeScreen(Screen[None]):
             self._reset_game(reset_score=True)
 
     def action_back(self) -> None:
+        self._flush_high_score()
         self.app.pop_screen()
 
+    def on_unmount(self) -> None:
+        self._flush_high_score()
+
     def action_restart(self) -> None:
         self._reset_game(reset_score=True)
 
@@ -83,6 +111,7 @@ class SnakeScreen(Screen[None]):
         if self.game_over:
             return
         self.paused = not self.paused
+        self._render_dirty = True
         self._render_board()
 
     def action_move_up(self) -> None:
@@ -103,18 +132,21 @@ class SnakeScreen(Screen[None]):
         if direction == (-self.direction[0], -self.direction[1]):
             return
         self.next_direction = direction
+        self._render_dirty = True
 
     def _reset_game(self, reset_score: bool) -> None:
         center_x = self.width // 2
         center_y = self.height // 2
-        self.snake = [
-            (center_x, center_y),
-            (center_x - 1, center_y),
-            (center_x - 2, center_y),
-        ]
+        center = center_y * self.width + center_x
+        self.snake = deque([center, center - 1, center - 2])
         self.direction = (1, 0)
         self.next_direction = (1, 0)
-        self.obstacles = self._build_obstacles()
+        self._snake_set = set(self.snake)
+        key = (self.width, self.height)
+        cached = self._obstacle_cache.get(key)
+        if cached is None:
+            cached = self._obstacle_cache[key] = self._build_obstacles()
+        self.obstacles, self._obstacles_by_row = cached
         self.food = self._spawn_food()
         self.special_food = None
         self.special_food_ticks = 0
@@ -124,16 +156,77 @@ class SnakeScreen(Screen[None]):
         self.level = 1
         self.food_eaten = 0
         self.tick_seconds = 0.11
+        self._tick_interval_ns = int(self.tick_seconds * 1_000_000_000)
         if reset_score:
             self.score = 0
-
-        if self._timer is not None:
-            self._timer.stop()
-        self._timer = self.set_interval(self.tick_seconds, self._game_tick)
+        self._render_dirty = True
+        self._reset_render_cache()
+
+        # One fixed fast timer drives a monotonic-deadline scheduler;
+        # speed-ups just shrink the deadline instead of tearing down and
+        # recreating the Textual timer on every level.
+        if self._timer is None:
+            self._timer = self.set_interval(0.01, self._scheduler_tick)
+        self._last_tick_ns = time.monotonic_ns()
         self._render_board()
 
+    def _scheduler_tick(self) -> None:
+        now = time.monotonic_ns()
+        if now - self._last_tick_ns < self._tick_interval_ns:
+            return
+        self._last_tick_ns = now
+        self._game_tick()
+
+    def _reset_render_cache(self) -> None:
+        # The palette is fixed, so the seven possible cell strings are
+        # invariants of cell_width; build them once, ordered by cell code.
+        width = self.width
+        self._cell_strings = (
+            " " * self.cell_width,
+            self._cell("#b9ff93"),
+            self._cell("#79d36e"),
+            self._cell("#6d5aa5"),
+            self._cell("#ff8eb0", "◆", "#1a1028"),
+            self._cell("#ffd56a", "✦", "#1a1028"),
+            self._cell("#fff2c2", "✦", "#1a1028"),
+        )
+
+        # Rendering is diff-based: the code grid and joined row strings
+        # persist between frames, and game logic marks the few cells it
+        # touches. A fresh bytearray is all EMPTY, so the initial frame
+        # only writes the occupants.
+        grid = bytearray(width * self.height)
+        for y, xs in self._obstacles_by_row.items():
+            base = y * width
+            for x in xs:
+                grid[base + x] = OBSTACLE
+        for i, code in enumerate(self.snake):
+            grid[code] = HEAD if i == 0 else BODY
+        grid[self.food] = FOOD
+        self._grid = grid
+        # Row joins read the codes through a persistent memoryview;
+        # slicing it is zero-copy, so rejoining a row allocates no
+        # temporary buffer.
+        view = self._grid_view = memoryview(grid)
+        strings = self._cell_strings
+        # Each cache entry is the row already duplicated cell_height
+        # times (trailing newline included), so assembling the canvas is
+        # a single join with no per-frame duplication pass.
+        cell_height = self.cell_height
+        self._row_cache = [
+            (
+                "".join(map(strings.__getitem__, view[y * width : (y + 1) * width]))
+                + "\n"
+            )
+            * cell_height
+            for y in range(self.height)
+        ]
+        self._dirty_cells: set[int] = set()
+        self._full_repaint = True
+        self._prev_score_sig: tuple | None = None
+
     def _fit_board_to_canvas(self) -> bool:
-        canvas = self.query_one("#snake_canvas", Static)
+        canvas = self._canvas_widget
         canvas_w = max(1, canvas.size.width)
         canvas_h = max(1, canvas.size.height)
 
@@ -148,30 +241,46 @@ class SnakeScreen(Screen[None]):
 
     def _game_tick(self) -> None:
         if self.game_over or self.paused:
-            self._render_board()
+            # A frozen frame re-renders only after something changed it
+            # (pause toggle, queued direction, restart) — not 9x/second.
+            if self._render_dirty:
+                self._render_board()
             return
 
+        self._render_dirty = True
         self.direction = self.next_direction
-        head_x, head_y = self.snake[0]
+        head = self.snake[0]
+        head_y, head_x = divmod(head, self.width)
         next_x = (head_x + self.direction[0]) % self.width
         next_y = (head_y + self.direction[1]) % self.height
-        next_head = (next_x, next_y)
-
-        if next_head in self.obstacles or next_head in self.snake:
+        next_head = next_y * self.width + next_x
+
+        # O(1) membership against the cell set; the tail is exempt because
+        # it vacates its cell on the same tick (unless the snake grows,
+        # in which case the head lands on food, never on the tail).
+        if next_head in self.obstacles or (
+            next_head in self._snake_set and next_head != self.snake[-1]
+        ):
             self.game_over = True
+            self._render_dirty = True
             if self.score > self.high_score:
                 self.high_score = self.score
-                self._save_high_score(self.high_score)
+                self._high_score_dirty = True
+            self._flush_high_score()
             self._render_board()
             return
 
-        self.snake.insert(0, next_head)
+        self.snake.appendleft(next_head)
+        self._snake_set.add(next_head)
+        self._dirty_cells.add(head)
+        self._dirty_cells.add(next_head)
         grew = False
 
         if next_head == self.food:
             self.score += 10
             self.food_eaten += 1
             self.food = self._spawn_food()
+            self._dirty_cells.add(self.food)
             grew = True
 
             if self.food_eaten % 5 == 0:
@@ -180,7 +289,7 @@ class SnakeScreen(Screen[None]):
 
             if self.score > self.high_score:
                 self.high_score = self.score
-                self._save_high_score(self.high_score)
+                self._high_score_dirty = True
 
         if self.special_food is not None and next_head == self.special_food:
             self.score += 50
@@ -190,10 +299,15 @@ class SnakeScreen(Screen[None]):
             grew = True
             if self.score > self.high_score:
                 self.high_score = self.score
-                self._save_high_score(self.high_score)
+                self._high_score_dirty = True
 
         if not grew:
-            self.snake.pop()
+            tail = self.snake.pop()
+            # When the head just moved onto the vacated tail cell, the
+            # cell is still occupied and must stay in the set.
+            if tail != next_head:
+                self._snake_set.discard(tail)
+            self._dirty_cells.add(tail)
 
         self._update_special_food()
         self._render_board()
@@ -202,6 +316,7 @@ class SnakeScreen(Screen[None]):
         if self.special_food is not None:
             self.special_food_ticks -= 1
             if self.special_food_ticks <= 0:
+                self._dirty_cells.add(self.special_food)
                 self.special_food = None
                 self.special_food_cooldown = 30
             return
@@ -210,18 +325,17 @@ class SnakeScreen(Screen[None]):
         if self.special_food_cooldown <= 0:
             self.special_food = self._spawn_food()
             self.special_food_ticks = 28
+            self._dirty_cells.add(self.special_food)
 
     def _increase_speed(self) -> None:
-        new_speed = max(0.06, self.tick_seconds - 0.01)
-        if abs(new_speed - self.tick_seconds) < 1e-9:
-            return
-        self.tick_seconds = new_speed
-        if self._timer is not None:
-            self._timer.stop()
-        self._timer = self.set_interval(self.tick_seconds, self._game_tick)
-
-    def _build_obstacles(self) -> set[tuple[int, int]]:
-        obstacles: set[tuple[int, int]] = set()
+        self.tick_seconds = max(0.06, self.tick_seconds - 0.01)
+        self._tick_interval_ns = int(self.tick_seconds * 1_000_000_000)
+
+    def _build_obstacles(
+        self,
+    ) -> tuple[frozenset[int], dict[int, frozenset[int]]]:
+        width = self.width
+        obstacles: set[int] = set()
         center_x = self.width // 2
         center_y = self.height // 2
         ring_half_w = max(3, self.width // 5)
@@ -235,58 +349,91 @@ class SnakeScreen(Screen[None]):
         for x in range(left, right + 1):
             if x in {center_x - 1, center_x, center_x + 1}:
                 continue
-            obstacles.add((x, top))
-            obstacles.add((x, bottom))
+            obstacles.add(top * width + x)
+            obstacles.add(bottom * width + x)
         for y in range(top + 1, bottom):
             if y in {center_y - 1, center_y, center_y + 1}:
                 continue
-            obstacles.add((left, y))
-            obstacles.add((right, y))
-        return obstacles
-
-    def _spawn_food(self) -> tuple[int, int]:
-        blocked = set(self.snake) | self.obstacles
+            obstacles.add(y * width + left)
+            obstacles.add(y * width + right)
+
+        by_row: dict[int, set[int]] = {}
+        for code in obstacles:
+            y, x = divmod(code, width)
+            by_row.setdefault(y, set()).add(x)
+        # The ring never changes after construction; freezing documents
+        # that invariant.
+        return frozenset(obstacles), {
+            y: frozenset(xs) for y, xs in by_row.items()
+        }
+
+    def _spawn_food(self) -> int:
+        blocked = self._snake_set | self.obstacles
         if self.special_food is not None:
             blocked.add(self.special_food)
 
+        # While the board is mostly open, rejection sampling finds a free
+        # cell in O(1) expected tries; the full enumeration only runs on
+        # a crowded board where sampling could stall.
+        width = self.width
+        if len(blocked) < width * self.height * 0.75:
+            for _ in range(50):
+                x = random.randrange(width)
+                y = random.randrange(self.height)
+                point = y * width + x
+                if point not in blocked:
+                    return point
+
         options = [
-            (x, y)
-            for y in range(self.height)
-            for x in range(self.width)
-            if (x, y) not in blocked
+            code for code in range(width * self.height) if code not in blocked
         ]
         if not options:
-            return (0, 0)
+            return 0
         return random.choice(options)
 
+    def _resolve_cell(self, point: int) -> int:
+        # The head test precedes the set lookup, so the incrementally
+        # maintained cell set doubles as the body set — no per-frame
+        # set(self.snake[1:]) rebuild.
+        if point == self.snake[0]:
+            return HEAD
+        if point in self._snake_set:
+            return BODY
+        if point in self.obstacles:
+            return OBSTACLE
+        if point == self.food:
+            return FOOD
+        if self.special_food is not None and point == self.special_food:
+            return SPECIAL_A if self.special_food_ticks % 4 < 2 else SPECIAL_B
+        return EMPTY
+
     def _render_board(self) -> None:
-        snake_head = self.snake[0]
-        snake_body = set(self.snake[1:])
-        rows: list[str] = []
-
-        for y in range(self.height):
-            line: list[str] = []
-            for x in range(self.width):
-                point = (x, y)
-                if point == snake_head:
-                    line.append(self._cell("#b9ff93"))
-                elif point in snake_body:
-                    line.append(self._cell("#79d36e"))
-                elif point in self.obstacles:
-                    line.append(self._cell("#6d5aa5"))
-                elif point == self.food:
-                    line.append(self._cell("#ff8eb0", "◆", "#1a1028"))
-                elif self.special_food is not None and point == self.special_food:
-                    pulse_color = (
-                        "#ffd56a" if self.special_food_ticks % 4 < 2 else "#fff2c2"
-                    )
-                    line.append(self._cell(pulse_color, "✦", "#1a1028"))
-                else:
-                    line.append(" " * self.cell_width)
-
-            row_text = "".join(line)
-            for _ in range(self.cell_height):
-                rows.append(row_text)
+        # The special food pulses while alive, so its cell is always worth
+        # re-resolving; everything else comes from the dirty set the game
+        # logic maintained.
+        if self.special_food is not None:
+            self._dirty_cells.add(self.special_food)
+
+        grid = self._grid
+        width = self.width
+        dirty_rows: set[int] = set()
+        for point in self._dirty_cells:
+            cell = self._resolve_cell(point)
+            if grid[point] != cell:
+                grid[point] = cell
+                dirty_rows.add(point // width)
+        self._dirty_cells.clear()
+
+        strings = self._cell_strings
+        view = self._grid_view
+        for y in dirty_rows:
+            start = y * width
+            row_text = "".join(map(strings.__getitem__, view[start : start + width]))
+            self._row_cache[y] = (row_text + "\n") * self.cell_height
+
+        if dirty_rows or self._full_repaint:
+            self._full_repaint = False
+            self._canvas_widget.update("".join(self._row_cache)[:-1])
 
         if self.game_over:
             state = "[bold #ff8fb1]Game Over[/]"
@@ -295,21 +442,28 @@ class SnakeScreen(Screen[None]):
         else:
             state = "[bold #8df7b0]Running[/]"
 
-        bonus = (
-            f" Bonus: {self.special_food_ticks}"
-            if self.special_food is not None
-            else ""
+        # The score line is a pure function of these inputs; most ticks
+        # none of them move, so skip the formatting and widget update.
+        sig = (
+            self.score,
+            self.high_score,
+            len(self.snake),
+            self.level,
+            state,
+            self.special_food_ticks if self.special_food is not None else -1,
         )
-        score_text = (
-            f"Score [bold #e7dcff]{self.score}[/]  "
-            f"High [bold #e7dcff]{self.high_score}[/]  "
-            f"Len [bold #e7dcff]{len(self.snake)}[/]  "
-            f"Lvl [bold #e7dcff]{self.level}[/]  "
-            f"{state}{bonus}"
-        )
-
-        self.query_one("#snake_score", Static).update(score_text)
-        self.query_one("#snake_canvas", Static).update("\n".join(rows))
+        if sig != self._prev_score_sig:
+            self._prev_score_sig = sig
+            bonus = f" Bonus: {sig[5]}" if self.special_food is not None else ""
+            score_text = (
+                f"Score [bold #e7dcff]{self.score}[/]  "
+                f"High [bold #e7dcff]{self.high_score}[/]  "
+                f"Len [bold #e7dcff]{len(self.snake)}[/]  "
+                f"Lvl [bold #e7dcff]{self.level}[/]  "
+                f"{state}{bonus}"
+            )
+            self._score_widget.update(score_text)
+        self._render_dirty = False
 
     def _cell(
         self, background: str, symbol: str = "", foreground: str = "#101010"
@@ -325,23 +479,42 @@ class SnakeScreen(Screen[None]):
         root = Path(__file__).resolve().parents[2]
         data_dir = root / "data"
         data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir / "snake_high_score.json"
+        return data_dir / "snake_high_score.txt"
 
     def _load_high_score(self) -> int:
+        # The record is a single integer; plain text beats round-tripping
+        # it through JSON. Records written before the format change are
+        # read once from the old .json file and carried over on the next
+        # save.
         try:
             if not self._high_score_path.exists():
-                return 0
-            payload = json.loads(self._high_score_path.read_text(encoding="utf-8"))
-            value = int(payload.get("high_score", 0))
+                return self._load_legacy_high_score()
+            value = int(self._high_score_path.read_text(encoding="utf-8").strip())
             return max(0, value)
         except Exception:
             return 0
 
+    def _load_legacy_high_score(self) -> int:
+        legacy = self._high_score_path.with_suffix(".json")
+        try:
+            if not legacy.exists():
+                return 0
+            payload = json.loads(legacy.read_text(encoding="utf-8"))
+            return max(0, int(payload.get("high_score", 0)))
+        except Exception:
+            return 0
+
+    def _flush_high_score(self) -> None:
+        # Disk writes stay out of the eating hot path: score gains only
+        # mark the record dirty, and the file is written at the rare
+        # quiet points — death, leaving the screen, unmount.
+        if not self._high_score_dirty:
+            return
+        self._high_score_dirty = False
+        self._save_high_score(self.high_score)
+
     def _save_high_score(self, high_score: int) -> None:
         try:
-            payload = {"high_score": int(high_score)}
-            self._high_score_path.write_text(
-                json.dumps(payload, indent=2), encoding="utf-8"
-            )
+            self._high_score_path.write_text(str(int(high_score)), encoding="utf-8")
         except Exception:
             return